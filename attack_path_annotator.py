@@ -10,10 +10,29 @@ from tkinter import ttk
 from PIL import Image, ImageGrab, ImageTk, ImageDraw, ImageFont
 import os
 import io
+import csv
+import json
+import math
+
+
+# Columns expected in bulk import files (CSV header or JSON object keys)
+ARROW_FIELDS = ('start_x', 'start_y', 'end_x', 'end_y', 'label')
+COORDINATE_FIELDS = ARROW_FIELDS[:4]
+
+# Number of arrows drawn per idle callback when drawing large batches
+ARROW_DRAW_CHUNK = 500
+
+# Maximum number of labels visible at once in the label dialog
+LABEL_DIALOG_ROWS = 8
 
 
 class Arrow:
-    """Represents an attack path arrow"""
+    """Represents an attack path arrow
+
+    start/end coordinates are in display (canvas) pixels; orig_* coordinates
+    are in original image pixels and are the reference used for rescaling
+    and PDF export.
+    """
 
     def __init__(self, start_x, start_y, end_x, end_y, label=""):
         self.start_x = start_x
@@ -23,6 +42,135 @@ class Arrow:
         self.label = label
         self.canvas_items = []  # Store canvas item IDs for deletion
 
+        # Original image coordinates
+        self.orig_start_x = None
+        self.orig_start_y = None
+        self.orig_end_x = None
+        self.orig_end_y = None
+
+
+def read_arrow_records(filepath):
+    """Read raw arrow records from a CSV or JSON file
+
+    CSV files need a header row naming the coordinate columns (label is
+    optional). JSON files hold either a list of objects or an object with an
+    "arrows" list. Coordinates are in original image pixels.
+
+    Returns (records, locations): locations names each record for error
+    messages ("Line N" for CSV, "Record N" for JSON).
+    """
+    if os.path.splitext(filepath)[1].lower() == '.json':
+        with open(filepath, encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            if 'arrows' not in data:
+                raise ValueError('JSON object must contain an "arrows" list')
+            data = data['arrows']
+        if not isinstance(data, list):
+            raise ValueError("JSON file must contain a list of arrows")
+        locations = [f"Record {index}" for index in range(1, len(data) + 1)]
+        return data, locations
+
+    records = []
+    locations = []
+    with open(filepath, newline='', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        missing = [field for field in COORDINATE_FIELDS
+                   if field not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"CSV file is missing column(s): {', '.join(missing)}")
+        for record in reader:
+            records.append(record)
+            locations.append(f"Line {reader.line_num}")
+    return records, locations
+
+
+def parse_coordinates(record):
+    """Return a record's (start_x, start_y, end_x, end_y) as finite floats
+
+    Raises ValueError describing the problem if a coordinate is missing or
+    not a finite number.
+    """
+    missing = [field for field in COORDINATE_FIELDS
+               if record.get(field) in (None, "")]
+    if missing:
+        raise ValueError(f"missing field(s) {', '.join(missing)}")
+
+    coordinates = []
+    for field in COORDINATE_FIELDS:
+        value = record[field]
+        # JSON true/false would otherwise be accepted as 1.0/0.0
+        if isinstance(value, bool):
+            raise ValueError("coordinates must be numeric")
+        try:
+            value = float(value)
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError("coordinates must be numeric") from None
+        if not math.isfinite(value):
+            raise ValueError("coordinates must be numeric")
+        coordinates.append(value)
+
+    return tuple(coordinates)
+
+
+def validate_arrow_records(records, width, height, locations=None):
+    """Validate raw arrow records against an image of the given size
+
+    Returns (arrows, errors): arrows is a list of
+    (start_x, start_y, end_x, end_y, label) tuples in original image
+    coordinates, errors is a list of messages for rejected records.
+    """
+    arrows = []
+    errors = []
+
+    for index, record in enumerate(records):
+        where = locations[index] if locations else f"Record {index + 1}"
+
+        if not isinstance(record, dict):
+            errors.append(f"{where}: not an object")
+            continue
+
+        try:
+            start_x, start_y, end_x, end_y = parse_coordinates(record)
+        except ValueError as e:
+            errors.append(f"{where}: {e}")
+            continue
+
+        if not (0 <= start_x <= width and 0 <= end_x <= width and
+                0 <= start_y <= height and 0 <= end_y <= height):
+            errors.append(f"{where}: coordinates outside the image")
+            continue
+
+        if start_x == end_x and start_y == end_y:
+            errors.append(f"{where}: start and end points are identical")
+            continue
+
+        label = record.get('label')
+        if label is None:
+            label = ""
+        elif not isinstance(label, str):
+            errors.append(f"{where}: label must be text")
+            continue
+
+        arrows.append((start_x, start_y, end_x, end_y, label.strip()))
+
+    return arrows, errors
+
+
+def extend_labels(attack_labels, labels):
+    """Append labels not already in attack_labels, keeping first-seen order
+
+    Returns the list of labels that were added.
+    """
+    known_labels = set(attack_labels)
+    added = []
+    for label in labels:
+        if label and label not in known_labels:
+            known_labels.add(label)
+            added.append(label)
+    attack_labels.extend(added)
+    return added
+
 
 class AttackPathAnnotator:
     def __init__(self, root):
@@ -44,6 +192,10 @@ class AttackPathAnnotator:
         self.temp_line = None
         self.temp_crosshairs = []  # Store temporary crosshair IDs
 
+        # Arrows queued for deferred drawing (see draw_arrows)
+        self._draw_queue = []
+        self._draw_job = None
+
         # Display offsets
         self.image_x = 0
         self.image_y = 0
@@ -134,6 +286,10 @@ class AttackPathAnnotator:
         self.context_menu = tk.Menu(self.root, tearoff=0)
         self.context_menu.add_command(label="Create Arrow", command=self.start_arrow_mode)
         self.context_menu.add_command(label="Delete Arrow", command=self.delete_arrow_at_cursor)
+        self.context_menu.add_command(
+            label="Import Arrows...",
+            command=self.import_arrows_from_file
+        )
         self.context_menu.add_separator()
         self.context_menu.add_command(label="Clear All Arrows", command=self.clear_all_arrows)
 
@@ -319,7 +475,6 @@ class AttackPathAnnotator:
             end_y = event.y
 
             # Minimum arrow length check
-            import math
             distance = math.sqrt((end_x - self.arrow_start_x) ** 2 + (end_y - self.arrow_start_y) ** 2)
 
             if distance < 10:  # Too short, ignore
@@ -335,6 +490,7 @@ class AttackPathAnnotator:
             if label is not None:  # User didn't cancel
                 # Create arrow object
                 arrow = Arrow(self.arrow_start_x, self.arrow_start_y, end_x, end_y, label)
+                self.set_original_coords(arrow)
                 self.arrows.append(arrow)
 
                 # Draw the arrow
@@ -350,38 +506,62 @@ class AttackPathAnnotator:
         """Show dialog to select attack path label"""
         dialog = tk.Toplevel(self.root)
         dialog.title("Attack Path Type")
-        dialog.geometry("400x200")
         dialog.transient(self.root)
         dialog.grab_set()
 
         tk.Label(dialog, text="Select Attack Path Type:", font=('Arial', 11, 'bold')).pack(pady=10)
 
-        selected_label = tk.StringVar(value=self.attack_labels[0])
+        # Scrollable list so imported label vocabularies of any size fit
+        list_frame = tk.Frame(dialog)
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=30)
+
+        scrollbar = tk.Scrollbar(list_frame, orient=tk.VERTICAL)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        listbox = tk.Listbox(
+            list_frame,
+            height=min(len(self.attack_labels), LABEL_DIALOG_ROWS),
+            width=40,
+            exportselection=False,
+            font=('Arial', 10),
+            yscrollcommand=scrollbar.set
+        )
+        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.config(command=listbox.yview)
 
         for label in self.attack_labels:
-            rb = tk.Radiobutton(
-                dialog,
-                text=label,
-                variable=selected_label,
-                value=label,
-                font=('Arial', 10)
-            )
-            rb.pack(anchor=tk.W, padx=30, pady=5)
+            listbox.insert(tk.END, label)
+        listbox.selection_set(0)
+        listbox.focus_set()
 
         result = [None]  # Use list to capture result from nested function
 
-        def ok_clicked():
-            result[0] = selected_label.get()
+        def ok_clicked(event=None):
+            selection = listbox.curselection()
+            if selection:
+                result[0] = self.attack_labels[selection[0]]
             dialog.destroy()
 
-        def cancel_clicked():
+        def cancel_clicked(event=None):
             result[0] = None
             dialog.destroy()
 
+        listbox.bind('<Double-Button-1>', ok_clicked)
+        dialog.bind('<Return>', ok_clicked)
+        dialog.bind('<Escape>', cancel_clicked)
+
         button_frame = tk.Frame(dialog)
         button_frame.pack(pady=15)
 
-        ok_btn = tk.Button(button_frame, text="OK", command=ok_clicked, padx=20, pady=5, bg='#4CAF50', fg='white')
+        ok_btn = tk.Button(
+            button_frame,
+            text="OK",
+            command=ok_clicked,
+            padx=20,
+            pady=5,
+            bg='#4CAF50',
+            fg='white'
+        )
         ok_btn.pack(side=tk.LEFT, padx=10)
 
         cancel_btn = tk.Button(button_frame, text="Cancel", command=cancel_clicked, padx=20, pady=5)
@@ -392,6 +572,20 @@ class AttackPathAnnotator:
 
         return result[0]
 
+    def set_original_coords(self, arrow):
+        """Record an arrow's original image coordinates from its display coordinates"""
+        arrow.orig_start_x = (arrow.start_x - self.image_x) / self.scale_factor
+        arrow.orig_start_y = (arrow.start_y - self.image_y) / self.scale_factor
+        arrow.orig_end_x = (arrow.end_x - self.image_x) / self.scale_factor
+        arrow.orig_end_y = (arrow.end_y - self.image_y) / self.scale_factor
+
+    def set_display_coords(self, arrow):
+        """Position an arrow on the canvas from its original image coordinates"""
+        arrow.start_x = round(arrow.orig_start_x * self.scale_factor + self.image_x)
+        arrow.start_y = round(arrow.orig_start_y * self.scale_factor + self.image_y)
+        arrow.end_x = round(arrow.orig_end_x * self.scale_factor + self.image_x)
+        arrow.end_y = round(arrow.orig_end_y * self.scale_factor + self.image_y)
+
     def draw_arrow(self, arrow):
         """Draw an arrow on the canvas"""
         # Draw the arrow line
@@ -413,7 +607,6 @@ class AttackPathAnnotator:
             mid_y = (arrow.start_y + arrow.end_y) / 2
 
             # Calculate if arrow is horizontal-ish (offset text upward)
-            import math
             dx = arrow.end_x - arrow.start_x
             dy = arrow.end_y - arrow.start_y
             angle = abs(math.atan2(dy, dx))
@@ -433,6 +626,105 @@ class AttackPathAnnotator:
             )
             arrow.canvas_items.append(text_id)
 
+    def draw_arrows(self, arrows):
+        """Queue a batch of arrows for drawing
+
+        Arrows are drawn ARROW_DRAW_CHUNK at a time from idle callbacks, so
+        large imports and resize redraws return immediately and the window
+        stays responsive while the canvas items are created.
+        """
+        self._draw_queue.extend(arrows)
+        if self._draw_job is None and self._draw_queue:
+            self._draw_job = self.root.after_idle(self._draw_next_chunk)
+
+    def _draw_next_chunk(self):
+        """Draw the next chunk of queued arrows"""
+        chunk = self._draw_queue[:ARROW_DRAW_CHUNK]
+        del self._draw_queue[:ARROW_DRAW_CHUNK]
+
+        for arrow in chunk:
+            self.draw_arrow(arrow)
+
+        if self._draw_queue:
+            self._draw_job = self.root.after_idle(self._draw_next_chunk)
+        else:
+            self._draw_job = None
+
+    def cancel_pending_draws(self):
+        """Drop any arrows still waiting to be drawn"""
+        if self._draw_job is not None:
+            self.root.after_cancel(self._draw_job)
+            self._draw_job = None
+        self._draw_queue.clear()
+
+    def import_arrows_from_file(self):
+        """Prompt for a CSV/JSON file of attack paths and import them"""
+        if self.original_image is None:
+            messagebox.showerror("No Image", "No image loaded")
+            return
+
+        from tkinter import filedialog
+        filepath = filedialog.askopenfilename(
+            title="Import Attack Paths",
+            filetypes=[
+                ("Attack path files", "*.csv *.json"),
+                ("CSV files", "*.csv"),
+                ("JSON files", "*.json"),
+                ("All files", "*.*")
+            ]
+        )
+
+        if not filepath:
+            return
+
+        try:
+            records, locations = read_arrow_records(filepath)
+        except (OSError, ValueError, csv.Error) as e:
+            messagebox.showerror("Import Error", f"Failed to read attack paths:\n\n{str(e)}")
+            return
+
+        imported, errors = self.import_arrows(records, locations)
+
+        message = f"Imported {imported} arrow(s)"
+        if errors:
+            message += f"\n\nSkipped {len(errors)} invalid record(s):\n"
+            message += "\n".join(errors[:10])
+            if len(errors) > 10:
+                message += f"\n... and {len(errors) - 10} more"
+            messagebox.showwarning("Import", message)
+        else:
+            messagebox.showinfo("Import", message)
+
+    def import_arrows(self, records, locations=None):
+        """Validate and add a batch of arrows without prompting for labels
+
+        Records are mappings with ARROW_FIELDS keys, with coordinates in
+        original image pixels. New labels are added to attack_labels.
+        Returns (number imported, list of error messages).
+        """
+        if self.original_image is None:
+            return 0, ["No image loaded"]
+
+        width, height = self.original_image.size
+        valid, errors = validate_arrow_records(records, width, height, locations)
+
+        new_arrows = []
+        for start_x, start_y, end_x, end_y, label in valid:
+            arrow = Arrow(0, 0, 0, 0, label)
+            arrow.orig_start_x = start_x
+            arrow.orig_start_y = start_y
+            arrow.orig_end_x = end_x
+            arrow.orig_end_y = end_y
+            self.set_display_coords(arrow)
+            new_arrows.append(arrow)
+
+        extend_labels(self.attack_labels, (arrow.label for arrow in new_arrows))
+
+        self.arrows.extend(new_arrows)
+        self.draw_arrows(new_arrows)
+
+        return len(new_arrows), errors
+
     def delete_arrow_at_cursor(self):
         """Delete arrow near the last right-click position"""
         delete_threshold = 15  # pixels
@@ -441,7 +733,6 @@ class AttackPathAnnotator:
 
         for arrow in self.arrows:
             # Check distance from cursor to arrow start point
-            import math
             distance = math.sqrt(
                 (self.last_right_click_x - arrow.start_x) ** 2 +
                 (self.last_right_click_y - arrow.start_y) ** 2
@@ -456,8 +747,10 @@ class AttackPathAnnotator:
                 for item_id in arrow.canvas_items:
                     self.canvas.delete(item_id)
 
-                # Remove from list
+                # Remove from list (and from the draw queue if not yet drawn)
                 self.arrows.remove(arrow)
+                if arrow in self._draw_queue:
+                    self._draw_queue.remove(arrow)
 
             messagebox.showinfo("Deleted", f"Deleted {len(arrows_to_delete)} arrow(s)")
         else:
@@ -472,13 +765,12 @@ class AttackPathAnnotator:
             )
 
             if response:
-                for arrow in self.arrows:
-                    for item_id in arrow.canvas_items:
-                        self.canvas.delete(item_id)
-
+                self.cancel_pending_draws()
+                self.canvas.delete('arrow')
                 self.arrows.clear()
         else:
             # Silent clear if no arrows (used when loading new image)
+            self.cancel_pending_draws()
             self.arrows.clear()
 
     def finish_and_save(self):
@@ -501,11 +793,11 @@ class AttackPathAnnotator:
 
             # Draw all arrows on the original image
             for arrow in self.arrows:
-                # Convert coordinates from display to original image coordinates
-                orig_start_x = int((arrow.start_x - self.image_x) / self.scale_factor)
-                orig_start_y = int((arrow.start_y - self.image_y) / self.scale_factor)
-                orig_end_x = int((arrow.end_x - self.image_x) / self.scale_factor)
-                orig_end_y = int((arrow.end_y - self.image_y) / self.scale_factor)
+                # Use the arrow's original image coordinates
+                orig_start_x = round(arrow.orig_start_x)
+                orig_start_y = round(arrow.orig_start_y)
+                orig_end_x = round(arrow.orig_end_x)
+                orig_end_y = round(arrow.orig_end_y)
 
                 # Draw the arrow line
                 draw.line(
@@ -527,7 +819,6 @@ class AttackPathAnnotator:
                     mid_y = (orig_start_y + orig_end_y) // 2
 
                     # Calculate if arrow is horizontal-ish (offset text upward)
-                    import math
                     dx = orig_end_x - orig_start_x
                     dy = orig_end_y - orig_start_y
                     angle = abs(math.atan2(dy, dx))
@@ -581,8 +872,6 @@ class AttackPathAnnotator:
 
     def draw_arrowhead(self, draw, x1, y1, x2, y2):
         """Draw an arrowhead at the end of a line"""
-        import math
-
         # Calculate angle
         angle = math.atan2(y2 - y1, x2 - x1)
 
@@ -621,34 +910,16 @@ class AttackPathAnnotator:
         if self.original_image is None:
             return
 
-        # Store arrow data in original image coordinates before redraw
-        original_arrows = []
-        for arrow in self.arrows:
-            orig_arrow = {
-                'start_x': int((arrow.start_x - self.image_x) / self.scale_factor),
-                'start_y': int((arrow.start_y - self.image_y) / self.scale_factor),
-                'end_x': int((arrow.end_x - self.image_x) / self.scale_factor),
-                'end_y': int((arrow.end_y - self.image_y) / self.scale_factor),
-                'label': arrow.label
-            }
-            original_arrows.append(orig_arrow)
-
         # Redraw the image at new scale
+        self.cancel_pending_draws()
         self.display_image_on_canvas()
 
-        # Recreate arrows at new scale
-        self.arrows.clear()
-        for orig_arrow in original_arrows:
-            # Convert from original coordinates to new display coordinates
-            new_start_x = int(orig_arrow['start_x'] * self.scale_factor + self.image_x)
-            new_start_y = int(orig_arrow['start_y'] * self.scale_factor + self.image_y)
-            new_end_x = int(orig_arrow['end_x'] * self.scale_factor + self.image_x)
-            new_end_y = int(orig_arrow['end_y'] * self.scale_factor + self.image_y)
-
-            # Create new arrow with scaled coordinates
-            arrow = Arrow(new_start_x, new_start_y, new_end_x, new_end_y, orig_arrow['label'])
-            self.arrows.append(arrow)
-            self.draw_arrow(arrow)
+        # Reposition arrows from their original image coordinates
+        for arrow in self.arrows:
+            arrow.canvas_items.clear()
+            self.set_display_coords(arrow)
+
+        self.draw_arrows(self.arrows)
 
 
 def main():
@@ -0,0 +1,314 @@
+"""Tests for bulk attack path import (no display required)"""
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from types import SimpleNamespace
+
+from attack_path_annotator import (
+    ARROW_DRAW_CHUNK,
+    Arrow,
+    AttackPathAnnotator,
+    extend_labels,
+    read_arrow_records,
+    validate_arrow_records,
+)
+
+
+def arrow_record(start_x=10, start_y=20, end_x=30, end_y=40, label="Lateral Movement"):
+    return {
+        'start_x': start_x,
+        'start_y': start_y,
+        'end_x': end_x,
+        'end_y': end_y,
+        'label': label,
+    }
+
+
+class ReadArrowRecordsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def write(self, name, content, encoding='utf-8'):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, 'w', encoding=encoding, newline='') as f:
+            f.write(content)
+        return path
+
+    def test_csv_with_bom(self):
+        path = self.write(
+            'paths.csv',
+            "start_x,start_y,end_x,end_y,label\n1,2,3,4,Zone Boundary Breach\n",
+            encoding='utf-8-sig'
+        )
+        records, locations = read_arrow_records(path)
+        self.assertEqual(records[0]['start_x'], '1')
+        self.assertEqual(records[0]['label'], 'Zone Boundary Breach')
+        self.assertEqual(locations, ['Line 2'])
+
+    def test_csv_missing_column(self):
+        path = self.write('paths.csv', "start_x,start_y,end_x,label\n1,2,3,x\n")
+        with self.assertRaisesRegex(ValueError, 'end_y'):
+            read_arrow_records(path)
+
+    def test_csv_without_label_column(self):
+        path = self.write('paths.csv', "start_x,start_y,end_x,end_y\n1,2,3,4\n")
+        records, _ = read_arrow_records(path)
+        arrows, errors = validate_arrow_records(records, 100, 100)
+        self.assertEqual(arrows, [(1.0, 2.0, 3.0, 4.0, "")])
+        self.assertEqual(errors, [])
+
+    def test_csv_short_row_reports_file_line(self):
+        path = self.write(
+            'paths.csv',
+            "start_x,start_y,end_x,end_y,label\n"
+            "1,2,3,4,A\n"
+            "\n"
+            "5,6\n"
+        )
+        records, locations = read_arrow_records(path)
+        arrows, errors = validate_arrow_records(records, 100, 100, locations)
+        self.assertEqual(len(arrows), 1)
+        self.assertEqual(errors, ["Line 4: missing field(s) end_x, end_y"])
+
+    def test_json_list(self):
+        path = self.write('paths.json', json.dumps([arrow_record(), arrow_record()]))
+        records, locations = read_arrow_records(path)
+        self.assertEqual(len(records), 2)
+        self.assertEqual(locations, ['Record 1', 'Record 2'])
+
+    def test_json_arrows_object(self):
+        path = self.write('paths.json', json.dumps({'arrows': [arrow_record()]}))
+        records, _ = read_arrow_records(path)
+        self.assertEqual(records, [arrow_record()])
+
+    def test_json_object_without_arrows(self):
+        path = self.write('paths.json', json.dumps({'arrow': [arrow_record()]}))
+        with self.assertRaisesRegex(ValueError, 'arrows'):
+            read_arrow_records(path)
+
+    def test_json_non_list(self):
+        path = self.write('paths.json', json.dumps("not a list"))
+        with self.assertRaises(ValueError):
+            read_arrow_records(path)
+
+
+class ValidateArrowRecordsTest(unittest.TestCase):
+
+    def validate(self, *records):
+        return validate_arrow_records(list(records), 100, 50)
+
+    def test_valid_record(self):
+        arrows, errors = self.validate(arrow_record(label="  Lateral Movement "))
+        self.assertEqual(arrows, [(10.0, 20.0, 30.0, 40.0, "Lateral Movement")])
+        self.assertEqual(errors, [])
+
+    def test_out_of_bounds(self):
+        arrows, errors = self.validate(arrow_record(end_y=51), arrow_record(start_x=-1))
+        self.assertEqual(arrows, [])
+        self.assertEqual(errors, [
+            "Record 1: coordinates outside the image",
+            "Record 2: coordinates outside the image",
+        ])
+
+    def test_nan_and_infinity(self):
+        arrows, errors = self.validate(
+            arrow_record(start_x='nan'),
+            arrow_record(end_x=float('inf'))
+        )
+        self.assertEqual(arrows, [])
+        self.assertEqual(errors, [
+            "Record 1: coordinates must be numeric",
+            "Record 2: coordinates must be numeric",
+        ])
+
+    def test_integer_too_large_for_float(self):
+        arrows, errors = self.validate(arrow_record(start_x=10 ** 400), arrow_record())
+        self.assertEqual(len(arrows), 1)
+        self.assertEqual(errors, ["Record 1: coordinates must be numeric"])
+
+    def test_bool_coordinates(self):
+        arrows, errors = self.validate(arrow_record(start_x=True), arrow_record(end_y=False))
+        self.assertEqual(arrows, [])
+        self.assertEqual(len(errors), 2)
+        self.assertTrue(all('must be numeric' in error for error in errors))
+
+    def test_identical_points(self):
+        arrows, errors = self.validate(arrow_record(end_x=10, end_y=20))
+        self.assertEqual(arrows, [])
+        self.assertEqual(errors, ["Record 1: start and end points are identical"])
+
+    def test_non_string_label(self):
+        arrows, errors = self.validate(arrow_record(label={'x': 1}), arrow_record(label=['a']))
+        self.assertEqual(arrows, [])
+        self.assertEqual(errors, [
+            "Record 1: label must be text",
+            "Record 2: label must be text",
+        ])
+
+    def test_not_an_object(self):
+        arrows, errors = self.validate(5)
+        self.assertEqual(arrows, [])
+        self.assertEqual(errors, ["Record 1: not an object"])
+
+
+class ExtendLabelsTest(unittest.TestCase):
+
+    def test_deduplicates_and_keeps_order(self):
+        labels = ["Zone Boundary Breach", "Lateral Movement"]
+        added = extend_labels(
+            labels,
+            ["Remote Access", "Lateral Movement", "", "Remote Access", "Pivot"]
+        )
+        self.assertEqual(added, ["Remote Access", "Pivot"])
+        self.assertEqual(
+            labels,
+            ["Zone Boundary Breach", "Lateral Movement", "Remote Access", "Pivot"]
+        )
+
+
+class CoordinateScalingTest(unittest.TestCase):
+
+    def test_resizing_does_not_drift(self):
+        annotator = SimpleNamespace(scale_factor=1.0, image_x=10, image_y=10)
+        arrow = Arrow(0, 0, 0, 0)
+        arrow.orig_start_x, arrow.orig_start_y = 500.0, 250.0
+        arrow.orig_end_x, arrow.orig_end_y = 700.0, 300.0
+
+        for scale in (0.73, 0.61, 0.9, 0.55, 0.73):
+            annotator.scale_factor = scale
+            AttackPathAnnotator.set_display_coords(annotator, arrow)
+
+        self.assertEqual(arrow.start_x, round(500 * 0.73 + 10))
+        self.assertEqual((arrow.orig_start_x, arrow.orig_end_x), (500.0, 700.0))
+
+
+class FakeRoot:
+    """Stands in for tk.Tk, collecting idle callbacks instead of running them"""
+
+    def __init__(self):
+        self.idle_callbacks = []
+
+    def after_idle(self, callback):
+        self.idle_callbacks.append(callback)
+        return f"after#{len(self.idle_callbacks)}"
+
+    def after_cancel(self, job):
+        self.idle_callbacks.clear()
+
+
+class FakeCanvas:
+    """Stands in for tk.Canvas, handing out sequential item IDs"""
+
+    def __init__(self):
+        self.items = 0
+
+    def create_line(self, *args, **kwargs):
+        self.items += 1
+        return self.items
+
+    create_text = create_line
+
+
+class DeferredDrawingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.annotator = AttackPathAnnotator.__new__(AttackPathAnnotator)
+        self.annotator.root = FakeRoot()
+        self.annotator.canvas = FakeCanvas()
+        self.annotator._draw_queue = []
+        self.annotator._draw_job = None
+        self.arrows = [
+            Arrow(0, 0, 50, i, "Lateral Movement") for i in range(ARROW_DRAW_CHUNK + 10)
+        ]
+
+    def test_draws_in_chunks_from_idle_callbacks(self):
+        self.annotator.draw_arrows(self.arrows)
+        self.assertEqual(self.annotator.canvas.items, 0)
+
+        self.annotator.root.idle_callbacks.pop(0)()
+        self.assertEqual(self.annotator.canvas.items, ARROW_DRAW_CHUNK * 2)
+
+        self.annotator.root.idle_callbacks.pop(0)()
+        self.assertEqual(self.annotator.canvas.items, len(self.arrows) * 2)
+        self.assertEqual(self.annotator.root.idle_callbacks, [])
+        self.assertIsNone(self.annotator._draw_job)
+
+    def test_cancel_pending_draws(self):
+        self.annotator.draw_arrows(self.arrows)
+        self.annotator.cancel_pending_draws()
+        self.assertEqual(self.annotator.root.idle_callbacks, [])
+        self.assertEqual(self.annotator._draw_queue, [])
+        self.assertIsNone(self.annotator._draw_job)
+
+
+class ImportArrowsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.annotator = AttackPathAnnotator.__new__(AttackPathAnnotator)
+        self.annotator.root = FakeRoot()
+        self.annotator.canvas = FakeCanvas()
+        self.annotator._draw_queue = []
+        self.annotator._draw_job = None
+        self.annotator.original_image = SimpleNamespace(size=(2000, 1000))
+        self.annotator.arrows = []
+        self.annotator.attack_labels = ["Zone Boundary Breach", "Lateral Movement"]
+        self.annotator.scale_factor = 0.5
+        self.annotator.image_x = 10
+        self.annotator.image_y = 10
+
+    def test_imports_valid_records_and_reports_errors(self):
+        records = [
+            arrow_record(101.5, 200, 301, 400.25, "Remote Access"),
+            arrow_record(start_x='bad'),
+            arrow_record(label="Lateral Movement"),
+            arrow_record(end_x=2001),
+            arrow_record(label="Remote Access"),
+        ]
+
+        imported, errors = self.annotator.import_arrows(records)
+
+        self.assertEqual(imported, 3)
+        self.assertEqual(errors, [
+            "Record 2: coordinates must be numeric",
+            "Record 4: coordinates outside the image",
+        ])
+        self.assertEqual(len(self.annotator.arrows), 3)
+
+        arrow = self.annotator.arrows[0]
+        self.assertEqual(
+            (arrow.orig_start_x, arrow.orig_start_y, arrow.orig_end_x, arrow.orig_end_y),
+            (101.5, 200.0, 301.0, 400.25)
+        )
+        self.assertEqual(
+            (arrow.start_x, arrow.start_y, arrow.end_x, arrow.end_y),
+            (round(101.5 * 0.5 + 10), 110, round(301 * 0.5 + 10), round(400.25 * 0.5 + 10))
+        )
+        self.assertEqual(arrow.label, "Remote Access")
+        self.assertEqual(
+            self.annotator.attack_labels,
+            ["Zone Boundary Breach", "Lateral Movement", "Remote Access"]
+        )
+
+    def test_import_is_deferred_and_fast(self):
+        records = [
+            arrow_record(i % 1900, 10, 1990, i % 990 + 5, f"Conduit {i % 25}")
+            for i in range(5000)
+        ]
+
+        start = time.perf_counter()
+        imported, errors = self.annotator.import_arrows(records)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual((imported, errors), (5000, []))
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(self.annotator.canvas.items, 0)
+        self.assertEqual(len(self.annotator.attack_labels), 2 + 25)
+
+
+if __name__ == '__main__':
+    unittest.main()